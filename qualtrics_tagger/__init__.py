@@ -1,18 +1,53 @@
 import os
+import sys
+import importlib.util
+import re
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import mimetypes
 import zipfile
 import shutil
 import time
 import io
+import tempfile
 import json
+import hashlib
+import threading
 import logging
-from typing import Tuple, BinaryIO, List, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import BinaryIO, Callable, Iterator, List, Union
 
 try:
-    from scipy import misc
+    from PIL import Image
 except ImportError:
-    misc = None
+    Image = None
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import pyperclip
@@ -20,20 +55,155 @@ except ImportError:
     pyperclip = None
 
 import webbrowser
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if orjson else json.loads
+
+# number of images uploaded to Qualtrics concurrently
+UPLOAD_WORKERS = 16
+
+# timeouts (in seconds) for HTTP/2 uploads: connecting, and any single read/write/pool wait.
+# The latter is generous because a large image can take a while to send on a slow link,
+# but finite so a stalled upload fails instead of hanging create() forever.
+UPLOAD_CONNECT_TIMEOUT = 30.0
+UPLOAD_TIMEOUT = 300.0
+
+# bounds (in seconds) for the delay between report export progress checks
+EXPORT_POLL_MIN_DELAY = 0.25
+EXPORT_POLL_MAX_DELAY = 5.0
+
+# block size used when copying a downloaded report into its output file
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# write buffer size for the generated survey.txt
+SURVEY_WRITE_BUFFER_SIZE = 1 << 20
+
+# block size used when hashing images for the upload cache
+HASH_CHUNK_SIZE = 1 << 20
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg')
+
+# whether _walk_images visits directory entries in inode order
+_SORT_BY_INODE = sys.platform.startswith('linux')
+
+# MIME types for image extensions, so uploads don't need a mimetypes lookup per file
+_EXT_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+}
+
+
+def _image_mime_type(filename: str) -> str:
+    ext = os.path.splitext(filename)[1].lower()
+    return _EXT_MIME.get(ext) or mimetypes.guess_type(filename)[0]
+
+
+def _walk_images(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yields the directory entries of all image files under root.
+    On Linux, each directory is visited in inode order, which roughly follows on-disk layout and
+    makes reads more sequential on spinning disks.
+    Directories that can't be read are skipped, as os.walk does.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.warning('Skipping %s: %s', root, e)
+        return
+    if _SORT_BY_INODE:
+        entries.sort(key=lambda e: e.inode())
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_images(entry.path)
+        elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+            yield entry
+
+
+def _file_digest(path: str) -> str:
+    """
+    :return: content hash of the file at path, prefixed with the name of the hash algorithm.
+             Uses BLAKE3 if the blake3 module is installed, SHA-256 otherwise.
+    """
+    h = blake3.blake3() if blake3 else hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return ('blake3:' if blake3 else 'sha256:') + h.hexdigest()
+
+
+class _UploadCache:
+    """
+    Persistent map from (library ID, image content hash) to Qualtrics graphic ID, so re-running create()
+    doesn't upload images that are already in the library.
+    Stored as an append-only text file with one "key<TAB>graphic ID" line per uploaded image.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.ids = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    key, _, graphic_id = line.rstrip('\n').partition('\t')
+                    if graphic_id:
+                        self.ids[key] = graphic_id
+
+    def add(self, key: str, graphic_id: str) -> None:
+        """
+        Records an upload and immediately appends it to the cache file. Safe to call from multiple threads.
+        """
+        with self._lock:
+            self.ids[key] = graphic_id
+            with open(self.path, 'a') as f:
+                f.write(key + '\t' + graphic_id + '\n')
+
+
+# maps path separators to the pipe symbol used in embedded data field names
+_PATH_TO_ED_TABLE = str.maketrans({os.path.sep: '|'})
+
+# placeholders substituted into each question in question.txt
+_QUESTION_PLACEHOLDER_RE = re.compile(r'\{(image_path|image_url|image_id|image_ed)\}')
+
+
+def _render_template(parts: List[str], values: dict) -> str:
+    """
+    Fills in a template that was split with _QUESTION_PLACEHOLDER_RE.split().
+    Even indices of parts are literal text, odd indices are placeholder names (keys in values).
+    """
+    out = list(parts)
+    for i in range(1, len(out), 2):
+        out[i] = values[out[i]]
+    return ''.join(out)
+
+
+def _process_workers() -> int:
+    """
+    :return: number of worker processes to preprocess images with (one per core).
+             Windows' ProcessPoolExecutor refuses more than 61 workers.
+    """
+    workers = os.cpu_count() or 1
+    return min(workers, 61) if sys.platform == 'win32' else workers
 
-def _is_image(path: str) -> bool:
-    path = path.lower()
-    return path.endswith('.png') or path.endswith('.jpg')
 
+def _process_one(process_image: Callable[[str, str, int], None], images_dir: str, work_dir: str,
+                 max_image_width: int, image: str) -> None:
+    """
+    Worker for preprocessing a single image in a separate process (see QualtricsTagger.create).
+    The output directory must already exist.
+    :param process_image: the tagger's _process_image (bound, so subclass overrides of any kind are respected)
+    :param image: path to the image, relative to images_dir
+    """
+    inpath = os.path.join(images_dir, image)
+    outpath = os.path.join(work_dir, image)
 
-def _clamp_img_size(img, max_width: int = None, max_height: int = None) -> Tuple[float, float]:
-    size = img.shape[0:2]
-    scale = (max_height / size[0] if max_height else 1.0, max_width / size[1] if max_width else 1.0)
-    scale = min(scale[0], scale[1])
-    return round(size[0] * scale), round(size[1] * scale)
+    logger.info('Processing %s', inpath)
+    process_image(inpath, outpath, max_image_width)
 
 
 class QualtricsTagger:
@@ -41,7 +211,7 @@ class QualtricsTagger:
     Class for creating and retrieving results from Qualtrics surveys designed
     around image annotation.
     """
-    def __init__(self, api_token: str, url_base: str = 'https://qualtrics.com'):
+    def __init__(self, api_token: str, url_base: str = 'https://qualtrics.com', http2: bool = False):
         """
         :param api_token: API token, found by clicking the top-right portrait -> "Account Settings" -> "Qualtrics IDs"
                           in the Qualtrics web interface.
@@ -49,6 +219,9 @@ class QualtricsTagger:
                           or you will encounter authorization errors when using the API.
         :param url_base: Base URL for accessing Qualtrics. Usually "https://[organization].qualtrics.com".
                          Must start with "https" and NOT end in a trailing slash.
+        :param http2: If True, create() uploads images concurrently over a single HTTP/2 connection using httpx
+                      (requires httpx and h2). These uploads bypass the requests session and requests-toolbelt
+                      streaming; each file is read into memory, with at most UPLOAD_WORKERS in flight at once.
         """
 
         self.api_token = api_token
@@ -56,6 +229,16 @@ class QualtricsTagger:
         assert not url_base.endswith('/')
         self.url_base = url_base
         self.api_endpoint = url_base + '/API/v3/'
+        self._graphics_url_tmpl = self.api_endpoint + 'libraries/{}/graphics'
+
+        # shared keep-alive session for all API calls, so concurrent requests reuse pooled connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=2 * UPLOAD_WORKERS))
+        self.session.headers['X-API-TOKEN'] = api_token
+
+        if http2 and not (httpx and importlib.util.find_spec('h2')):
+            raise ImportError('httpx and h2 could not be imported. HTTP/2 uploads cannot be performed.')
+        self.http2 = http2
 
     def create(self, survey_name: str, images_dir: str, library_id: str, templates_dir: str = './templates',
                max_image_width: Union[int, None] = None) -> str:
@@ -70,74 +253,110 @@ class QualtricsTagger:
                               templates_dir/survey_header.txt: start of the survey. Include custom questions here.
                               templates_dir/header.html: will prompt user to copy contents into Qualtrics header field.
         :param max_image_width: Optional maximum width of the image. If images exceed this width, they will be
-                                downscaled using SciPy's misc module (i.e. pillow). Use None to disable (default).
+                                downscaled using Pillow. Use None to disable (default).
+                                Resizing runs in worker processes; on platforms that start them with "spawn"
+                                (macOS, Windows), call create() from under an `if __name__ == '__main__':` guard.
         :return: the survey ID of the newly-created survey
         """
-        # directory for storing temporary files
-        work_dir = os.path.join(os.path.dirname(images_dir), os.path.basename(images_dir) + '_qualtrics')
-
         # build list of image files in images_dir
         images = []
-        for dirpath, dirnames, filenames in os.walk(images_dir):
-            for filename in filenames:
-                path = os.path.join(dirpath, filename)
-                if _is_image(path):
-                    relpath = os.path.relpath(path, images_dir)
-                    if '|' in relpath:
-                        raise RuntimeError(relpath + ': image paths cannot contain the pipe symbol (|).')
-                    images.append(relpath)
+        for entry in _walk_images(images_dir):
+            relpath = os.path.relpath(entry.path, images_dir)
+            if '|' in relpath:
+                raise RuntimeError(relpath + ': image paths cannot contain the pipe symbol (|).')
+            images.append(relpath)
         print(len(images), "images found.")
 
-        # preprocess
-        for image in images:
-            inpath = os.path.join(images_dir, image)
-            outpath = os.path.join(work_dir, image)
-            outdir = os.path.dirname(outpath)
-
-            # make sure directory for outfile exists
-            if not os.path.exists(outdir):
-                os.makedirs(outdir)
-
-            print("Processing", inpath)
-            self._process_image(inpath, outpath, max_image_width)
-
-        # upload to Qualtrics
-        image_ids = []
-        for image in images:
-            path = os.path.join(work_dir, image)
-            category = os.path.basename(images_dir)
-
-            print("Uploading", path)
-            id = self._upload_image(path, category, library_id)
-            image_ids.append(id)
+        # directory for storing temporary files
+        work_dir = os.path.join(os.path.dirname(images_dir), os.path.basename(images_dir) + '_qualtrics')
+        os.makedirs(work_dir, exist_ok=True)
+
+        if max_image_width:
+            # make sure output directories exist (once per directory, not per image)
+            for outdir in {os.path.dirname(os.path.join(work_dir, image)) for image in images}:
+                os.makedirs(outdir, exist_ok=True)
+
+            # preprocess (resizing is CPU-bound, so spread it across processes)
+            print("Processing", len(images), "images...")
+            with ProcessPoolExecutor(max_workers=_process_workers()) as ex:
+                list(ex.map(partial(_process_one, self._process_image, images_dir, work_dir, max_image_width), images))
+            upload_dir = work_dir
+        else:
+            # images are uploaded unchanged, so read them straight from images_dir
+            upload_dir = images_dir
+
+        # skip images whose contents were already uploaded to this library by a previous run
+        cache = _UploadCache(os.path.join(work_dir, '.upload_cache'))
+        paths = [os.path.join(upload_dir, image) for image in images]
+        keys = [library_id + ':' + _file_digest(path) for path in paths]
+        pending = {}  # cache key -> path, so identical images are only uploaded once
+        cached = 0
+        for path, key in zip(paths, keys):
+            if key in cache.ids:
+                cached += 1
+            else:
+                pending.setdefault(key, path)
+        print(cached, "images already uploaded.")
+        duplicates = len(images) - cached - len(pending)
+        if duplicates:
+            print(duplicates, "duplicate images will reuse another image's upload.")
+
+        # upload to Qualtrics, recording each graphic ID as soon as it's known
+        category = os.path.basename(images_dir)
+        graphics_url = self._graphics_url_tmpl.format(library_id)
+        path_keys = {path: key for key, path in pending.items()}
+
+        def uploaded(path: str, graphic_id: str) -> None:
+            cache.add(path_keys[path], graphic_id)
+
+        print("Uploading", len(pending), "images...")
+        if self.http2:
+            # multiplex uploads over a single HTTP/2 connection
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(self._upload_images_async(list(pending.values()), category, graphics_url,
+                                                                  on_uploaded=uploaded))
+            finally:
+                loop.close()
+        else:
+            def upload(path: str) -> None:
+                logger.info('Uploading %s', path)
+                uploaded(path, self._upload_image(path, category, graphics_url))
+
+            with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+                list(pool.map(upload, pending.values()))
+
+        image_ids = [cache.ids[key] for key in keys]
+
+        # load header template from survey_header.txt
+        with open(os.path.join(templates_dir, 'survey_header.txt'), 'r') as headerf:
+            header_template = headerf.read()
+
+        # load question template from question.txt and split it on its placeholders once
+        with open(os.path.join(templates_dir, 'question.txt'), 'r') as templatef:
+            question_parts = _QUESTION_PLACEHOLDER_RE.split(templatef.read())
+
+        # add embedded data declarations to header
+        image_eds = [self.image_path_to_ed(p) for p in images]
+        ed_decls = '\n'.join('[[ED:' + ed + ']]' for ed in image_eds)
+        header = header_template.replace('{ed_declarations}', ed_decls) + '\n'
+
+        # render questions
+        questions = [
+            _render_template(question_parts, {
+                'image_path': image,
+                'image_url': self._graphic_id_to_url(image_id),
+                'image_id': image_id,
+                'image_ed': image_ed,
+            }) + '\n'
+            for image, image_id, image_ed in zip(images, image_ids, image_eds)
+        ]
 
         # generate survey.txt
         survey_path = os.path.join(work_dir, 'survey.txt')
-        with open(survey_path, 'wt') as outf:
-            # write header
-            with open(os.path.join(templates_dir, 'survey_header.txt'), 'r') as headerf:
-                header_template = headerf.read()
-
-            # add embedded data declarations
-            ed_decls = ['[[ED:' + self.image_path_to_ed(p) + ']]' for p in images]
-            text = header_template.replace('{ed_declarations}', '\n'.join(ed_decls))
-            outf.write(text)
-            outf.write('\n')
-
-            # load question template from question.txt
-            with open(os.path.join(templates_dir, 'question.txt'), 'r') as templatef:
-                question_template = templatef.read()
-
-            # write questions to survey.txt
-            for image, image_id in zip(images, image_ids):
-                image_url = self._graphic_id_to_url(image_id)
-                text = question_template\
-                    .replace('{image_path}', image)\
-                    .replace('{image_url}', image_url)\
-                    .replace('{image_id}', image_id)\
-                    .replace('{image_ed}', self.image_path_to_ed(image))
-                outf.write(text)
-                outf.write('\n')
+        with open(survey_path, 'wt', encoding='utf-8', buffering=SURVEY_WRITE_BUFFER_SIZE) as outf:
+            outf.write(header)
+            outf.writelines(questions)
 
         # import (create) survey online
         survey_id = self._import_survey(survey_name, survey_path)
@@ -163,56 +382,82 @@ class QualtricsTagger:
         return survey_id
 
     @staticmethod
-    def _process_image(in_path: str, out_path: str, max_image_width: Union[int, None]) -> None:
+    def _process_image(in_path: str, out_path: str, max_image_width: int) -> None:
         """
         Processes in_path and saves the result in out_path.
-        This implementation down-samples images to a max width of 900px while maintaining aspect ratio.
+        Only called by create() when max_image_width is set; otherwise images are uploaded unchanged.
+        This implementation down-samples images to a max width of max_image_width while maintaining aspect ratio.
         """
         # skip if out file was already created (by a previous run)
         if os.path.exists(out_path):
             return
 
-        if not max_image_width:
-            # if we're not changing the image, make a (relative) symlink if possible to save space
-            # note Windows doesn't support symlinks
-            try:
-                in_rel = os.path.relpath(in_path, os.path.dirname(os.path.abspath(out_path)))
-                os.symlink(in_rel, out_path)
-            except:
-                shutil.copy(in_path, out_path)
-        else:
-            if not misc:
-                raise ImportError('scipy.misc could not be imported. Image downscaling cannot be performed.')
-            img = misc.imread(in_path)
-            new_size = _clamp_img_size(img, max_width=max_image_width)
-            new_img = misc.imresize(img, new_size, interp="bicubic")
-            misc.imsave(out_path, new_img)
+        if not Image:
+            raise ImportError('Pillow could not be imported. Image downscaling cannot be performed.')
+        # thumbnail() only ever shrinks, so images already narrower than max_image_width are left as-is
+        with Image.open(in_path) as img:
+            img.thumbnail((max_image_width, 10**9), Image.LANCZOS)
+            img.save(out_path, optimize=True)
 
-    def _upload_image(self, path: str, folder: str, library_id: str) -> str:
+    def _upload_image(self, path: str, folder: str, graphics_url: str) -> str:
         """
         Uploads an image file to a Qualtrics graphics library.
         :param path: path to image file
         :param folder: Qualtrics library folder name to upload to
-        :param library_id: Qualtrics library ID to upload into (get from "Qualtrics IDs" page)
+        :param graphics_url: graphics endpoint of the Qualtrics library to upload into (see _graphics_url_tmpl)
         :return: Qualtrics ID corresponding to the uploaded image (IM_*)
         """
-        url = self.api_endpoint + 'libraries/' + library_id + '/graphics'
-
-        headers = {
-            'X-API-TOKEN': self.api_token
-        }
-
-        filename = os.path.basename(path)
-        filetype = mimetypes.guess_type(filename)[0]
-        files = {
-            'file': (filename, open(path, 'rb'), filetype)
-        }
+        filetype = _image_mime_type(os.path.basename(path))
 
         data = {'folder': folder} if (folder and len(folder) > 0) else {}
-        r = requests.post(url, headers=headers, data=data, files=files)
-        logger.debug(r.text)
+        r = self._post_file(graphics_url, data, path, filetype)
         return r.json()['result']['id']
 
+    async def _upload_images_async(self, paths: List[str], folder: str, graphics_url: str,
+                                   on_uploaded: Callable[[str, str], None] = None) -> List[str]:
+        """
+        Uploads image files to a Qualtrics graphics library concurrently over HTTP/2 (requires httpx and h2).
+        At most UPLOAD_WORKERS uploads are in flight at once. If any upload fails, the first error is raised
+        once every upload has finished.
+        :param paths: paths to image files
+        :param folder: Qualtrics library folder name to upload to
+        :param graphics_url: graphics endpoint of the Qualtrics library to upload into (see _graphics_url_tmpl)
+        :param on_uploaded: optional callback, called with (path, graphic ID) as soon as each upload finishes.
+                            It runs in the default executor (off the event loop), so it must be thread-safe.
+        :return: Qualtrics IDs corresponding to the uploaded images (IM_*), in the same order as paths
+        """
+        data = {'folder': folder} if (folder and len(folder) > 0) else {}
+        semaphore = asyncio.Semaphore(UPLOAD_WORKERS)
+        loop = asyncio.get_running_loop()
+        timeout = httpx.Timeout(UPLOAD_TIMEOUT, connect=UPLOAD_CONNECT_TIMEOUT)
+
+        def read_file(path: str) -> bytes:
+            with open(path, 'rb') as f:
+                return f.read()
+
+        async with httpx.AsyncClient(http2=True, headers={'X-API-TOKEN': self.api_token}, timeout=timeout) as client:
+            async def upload(path: str) -> str:
+                async with semaphore:
+                    logger.info('Uploading %s', path)
+                    filename = os.path.basename(path)
+                    # read in the default executor so disk I/O doesn't block the event loop
+                    content = await loop.run_in_executor(None, read_file, path)
+                    files = {'file': (filename, content, _image_mime_type(filename))}
+                    r = await client.post(graphics_url, data=data, files=files)
+                    logger.debug(r.text)
+                    graphic_id = r.json()['result']['id']
+                    if on_uploaded:
+                        await loop.run_in_executor(None, on_uploaded, path, graphic_id)
+                    return graphic_id
+
+            # let every upload settle before the client is closed, then surface the first failure
+            results = await asyncio.gather(*(upload(p) for p in paths), return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
     def _import_survey(self, name: str, path: str) -> str:
         """
         Import a survey text file into Qualtrics. See here for the format:
@@ -223,19 +468,29 @@ class QualtricsTagger:
         """
         url = self.api_endpoint + 'surveys'
 
-        headers = {
-            'X-API-TOKEN': self.api_token
-        }
+        data = {'name': name}
+        r = self._post_file(url, data, path, 'application/vnd.qualtrics.survey.txt')
+        return r.json()['result']['id']
 
+    def _post_file(self, url: str, data: dict, path: str, filetype: str) -> requests.Response:
+        """
+        POSTs a multipart form containing the fields in data plus the file at path (as the 'file' field).
+        If requests-toolbelt is installed, the body is streamed from disk instead of being read into memory.
+        :param url: URL to POST to
+        :param data: additional form fields
+        :param path: path to the file to upload
+        :param filetype: MIME type of the file
+        :return: the response
+        """
         filename = os.path.basename(path)
-        files = {
-            'file': (filename, open(path, 'rb'), 'application/vnd.qualtrics.survey.txt')
-        }
-
-        data = {'name': name}
-        r = requests.post(url, headers=headers, data=data, files=files)
+        with open(path, 'rb') as f:
+            if MultipartEncoder:
+                m = MultipartEncoder(fields=dict(data, file=(filename, f, filetype)))
+                r = self.session.post(url, data=m, headers={'Content-Type': m.content_type})
+            else:
+                r = self.session.post(url, data=data, files={'file': (filename, f, filetype)})
         logger.debug(r.text)
-        return r.json()['result']['id']
+        return r
 
     def _graphic_id_to_url(self, graphic_id: str) -> str:
         """
@@ -249,7 +504,7 @@ class QualtricsTagger:
         """
         :return: Embedded data field name corresponding to the given image.
         """
-        return "anno_" + path.replace(os.path.sep, '|')
+        return "anno_" + path.translate(_PATH_TO_ED_TABLE)
 
     def ed_to_image_path(self, ed):
         """
@@ -268,14 +523,11 @@ class QualtricsTagger:
         """
 
         url = self.api_endpoint + 'responseexports'
-        headers = {
-            'X-API-TOKEN': self.api_token,
-        }
         data = {
             'surveyId': survey_id,
             'format': format_name
         }
-        r = requests.post(url, headers=headers, json=data)
+        r = self.session.post(url, json=data)
         logger.debug(r.text)
         return r.json()['result']['id']
 
@@ -288,13 +540,21 @@ class QualtricsTagger:
                  (this call returns the 'result' portion of the response)
         """
         url = self.api_endpoint + 'responseexports/' + export_id
-        headers = {
-            'X-API-TOKEN': self.api_token,
-        }
-        r = requests.get(url, headers=headers)
+        r = self.session.get(url)
         logger.debug(r.text)
         return r.json()['result']
 
+    def _is_qualtrics_url(self, url: str) -> bool:
+        """
+        :return: True if url is an HTTPS URL on url_base's host or on qualtrics.com (or one of its subdomains),
+                 i.e. somewhere it is safe to send the API token.
+        """
+        parsed = urlparse(url)
+        host = parsed.hostname
+        if parsed.scheme != 'https' or not host:
+            return False
+        return host == urlparse(self.url_base).hostname or host == 'qualtrics.com' or host.endswith('.qualtrics.com')
+
     def _get_export_result(self, export_id: str, out_file: Union[BinaryIO, io.FileIO]) -> None:
         """
         Waits until a report is ready, then downloads it into out_file.
@@ -303,16 +563,30 @@ class QualtricsTagger:
         :param export_id: export ID (from _generate_report)
         :param out_file: file-like object to save downloaded data in
         """
+        # poll with exponential backoff, dropping back to the minimum delay whenever progress is made
+        delay = EXPORT_POLL_MIN_DELAY
+        last_percent = None
         while True:
             r = self._get_export_progress(export_id)
             if r['status'] == 'in progress':
                 print('Waiting for report (' + str(r['percentComplete']) + '% complete)...')
-                time.sleep(1.5)
+                if r['percentComplete'] != last_percent:
+                    last_percent = r['percentComplete']
+                    delay = EXPORT_POLL_MIN_DELAY
+                time.sleep(delay)
+                delay = min(delay * 1.5, EXPORT_POLL_MAX_DELAY)
             else:
                 if r['status'] == 'complete':
                     print("Report exported. Downloading from: " + r['file'])
-                    r = requests.get(r['file'], headers={'X-API-TOKEN': self.api_token}, stream=True)
-                    shutil.copyfileobj(r.raw, out_file)
+                    # the API token is only sent if the file is served by Qualtrics itself,
+                    # so it doesn't leak to a pre-signed third-party URL
+                    if self._is_qualtrics_url(r['file']):
+                        r = self.session.get(r['file'], stream=True)
+                    else:
+                        r = requests.get(r['file'], stream=True)
+                    # decode any gzip/deflate transfer encoding so out_file receives the actual ZIP bytes
+                    r.raw.decode_content = True
+                    shutil.copyfileobj(r.raw, out_file, DOWNLOAD_CHUNK_SIZE)
                     break
                 else:
                     raise RuntimeError('Report could not be exported: ' + r['info']['reason'])
@@ -329,23 +603,36 @@ class QualtricsTagger:
         export_id = self._generate_report(survey_id, format_name)
         self._get_export_result(export_id, out_file)
 
+    def iter_responses(self, survey_id: str) -> Iterator[dict]:
+        """
+        Exports data from Qualtrics, parses the zip file, and yields each response as a dict.
+        Note that this data can contain unfinished surveys.
+        If ijson is installed, responses are parsed incrementally so memory use stays bounded for large exports.
+        Otherwise each file is parsed whole, using orjson if it is installed.
+        :param survey_id: survey ID
+        :return: iterator over responses
+        """
+        # download response data (zip file) into a temporary file rather than memory
+        # (not SpooledTemporaryFile: before Python 3.11 it lacks seekable(), which zipfile needs)
+        with tempfile.TemporaryFile() as zipf:
+            self.download_results(survey_id, zipf)
+
+            # loop through response data in zip files
+            # (may be in multiple files - see https://api.qualtrics.com/docs/response-exports)
+            with zipfile.ZipFile(zipf, mode='r') as zip:
+                for filename in zip.namelist():
+                    if ijson:
+                        with zip.open(filename) as f:
+                            yield from ijson.items(f, 'responses.item', use_float=True)
+                    else:
+                        yield from _json_loads(zip.read(filename))['responses']
+
     def get_responses(self, survey_id: str) -> List[dict]:
         """
         Exports data from Qualtrics, parses the zip file, and returns all responses as a list of dicts.
         Note that this data can contain unfinished surveys.
-        Note that this function is all in-memory and may fail for an extremely large amount of response data.
+        See "iter_responses" to avoid holding every response in memory at once.
         :param survey_id: survey ID
         :return: list of responses
         """
-        # download repsonse data (zip file) into an in-memory buffer
-        zipf = io.BytesIO()
-        self.download_results(survey_id, zipf)
-
-        # loop through response data in zip files
-        # (may be in multiple files - see https://api.qualtrics.com/docs/response-exports)
-        responses = []
-        with zipfile.ZipFile(zipf, mode='r') as zip:
-            for filename in zip.namelist():
-                data = json.loads(zip.read(filename))
-                responses += data['responses']
-        return responses
+        return list(self.iter_responses(survey_id))
@@ -11,7 +11,12 @@ setup(
     description='Module for creating and managing image annotation surveys using the Qualtrics platform.',
     extras_require={
         'automatic copy-to-clipboard': ['pyperclip'],
-        'image downscaling': ['scipy', 'Pillow'],
+        'image downscaling': ['Pillow'],
+        'streaming uploads': ['requests-toolbelt'],
+        'streaming response parsing': ['ijson>=3.1'],
+        'http2 uploads': ['httpx[http2]'],
+        'fast json parsing': ['orjson'],
+        'fast image hashing': ['blake3'],
     },
-    python_requires='>=3.5'
+    python_requires='>=3.6'
 )